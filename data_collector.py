@@ -2,12 +2,18 @@
 DART 데이터 대량 수집 파이프라인 (DART API 직접 호출)
 """
 import os
+import re
+import atexit
+import hashlib
 import time
 import json
 import logging
+import argparse
+import threading
 import requests
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 import pandas as pd
 from dotenv import load_dotenv
 import xml.etree.ElementTree as ET
@@ -28,12 +34,17 @@ print("="*60)
 
 # 환경 변수 로드
 load_dotenv()
-API_KEY = os.getenv('DART_API_KEY')
-if not API_KEY:
-    print("❌ 오류: .env 파일에서 DART_API_KEY를 찾을 수 없습니다")
+# 여러 키를 쓰는 경우 DART_API_KEYS에 쉼표로 구분해 입력 (없으면 DART_API_KEY 사용)
+API_KEYS = [
+    key.strip()
+    for key in (os.getenv('DART_API_KEYS') or os.getenv('DART_API_KEY') or '').split(',')
+    if key.strip()
+]
+if not API_KEYS:
+    print("❌ 오류: .env 파일에서 DART_API_KEYS 또는 DART_API_KEY를 찾을 수 없습니다")
     exit(1)
 
-print("✓ API 키 설정 완료")
+print(f"✓ API 키 {len(API_KEYS)}개 설정 완료")
 
 # DART API 엔드포인트
 BASE_URL = "https://opendart.fss.or.kr/api"
@@ -45,10 +56,137 @@ REPORT_TYPES = {
     '분기보고서': ['분기보고서'],
 }
 
+# 보고서명의 보고 기간 (예: '[기재정정]사업보고서 (2023.12)' → '2023.12')
+PERIOD_PATTERN = re.compile(r'\((\d{4}\.\d{2})\)')
+
+# API 키별 호출 제한
+KEY_MIN_INTERVAL = 0.5                     # 키별 최소 요청 간격 (초)
+KEY_DAILY_QUOTA = 20000                    # 키별 일일 요청 한도 (DART 기본 20,000건)
+KEY_USAGE_FILE = Path('data/key_usage.json')
+KEY_USAGE_SAVE_EVERY = 100                 # 사용량 저장 주기 (요청 수)
+KEY_USAGE_SAVE_SECONDS = 10                # 사용량 저장 주기 (초)
+
+# 해당 키를 더 쓰면 안 되는 DART 상태 코드 (다른 키로 재시도)
+KEY_QUOTA_STATUS = {'020'}                        # 요청 제한 초과
+KEY_INVALID_STATUS = {'010', '011', '012', '901'}  # 미등록/사용불가/허용되지 않은 IP/만료된 키
+
+# 감시(watch) 모드 설정
+WATCH_STATE_FILE = Path('data/watch_state.json')  # 마지막 처리 접수일자/접수번호
+WATCH_INTERVAL = 300                              # 폴링 주기 (초)
+WATCH_MAX_DAYS = 90                               # 고유번호 없는 목록 조회의 최대 기간 (DART 제한 3개월)
+
+class KeysExhaustedError(RuntimeError):
+    """모든 API 키가 일일 한도를 초과했거나 사용 불가 (각 메서드에서 삼키지 않고 상위로 전달)"""
+
+
+class ApiKey:
+    """API 키 하나의 호출 간격 및 일일 사용량 상태"""
+    def __init__(self, key: str, used: int = 0):
+        self.key = key
+        self.label = f"...{key[-6:]}"  # 로그에는 키 일부만 기록
+        self.id = hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]  # 사용량 파일용 식별자
+        self.used = used
+        self.next_at = 0.0             # 다음 요청 가능 시각 (time.monotonic 기준)
+        self.disabled = False
+
+
+class ApiKeyPool:
+    """
+    여러 API 키를 키별 호출 간격/일일 한도에 맞춰 분배
+    가장 빨리 쓸 수 있고 사용량이 적은 키를 우선 선택
+    """
+    def __init__(self, keys: List[str], min_interval: float = KEY_MIN_INTERVAL,
+                 daily_quota: int = KEY_DAILY_QUOTA, usage_file: Path = KEY_USAGE_FILE):
+        self.min_interval = min_interval
+        self.daily_quota = daily_quota
+        self.usage_file = usage_file
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()
+        self.unsaved = 0
+        self.saved_at = time.monotonic()
+        
+        self.date = datetime.now().strftime('%Y%m%d')
+        usage = self.load_usage()
+        self.keys = [ApiKey(key) for key in keys]
+        for k in self.keys:
+            k.used = usage.get(k.id, 0)
+        
+        # 주기 저장 사이에 종료되어도 사용량이 남도록 종료 시 저장
+        atexit.register(self.save_usage)
+    
+    def load_usage(self) -> Dict:
+        """오늘 사용량 로드 (날짜가 바뀌었으면 초기화)"""
+        if self.usage_file.exists():
+            with open(self.usage_file, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            if saved.get('date') == self.date:
+                return saved.get('usage', {})
+        return {}
+    
+    def save_usage(self):
+        """키별 사용량 저장 (파일 쓰기 중에도 요청 스레드가 막히지 않도록 풀 잠금은 스냅샷에만 사용)"""
+        with self.save_lock:
+            with self.lock:
+                snapshot = {
+                    'date': self.date,
+                    'usage': {k.id: k.used for k in self.keys}
+                }
+                self.unsaved = 0
+                self.saved_at = time.monotonic()
+            
+            self.usage_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.usage_file, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, indent=2, ensure_ascii=False)
+    
+    def acquire(self) -> ApiKey:
+        """요청에 사용할 키 선택 (호출 간격이 될 때까지 대기)"""
+        with self.lock:
+            today = datetime.now().strftime('%Y%m%d')
+            if today != self.date:
+                self.date = today
+                for k in self.keys:
+                    k.used = 0
+            
+            available = [k for k in self.keys if not k.disabled and k.used < self.daily_quota]
+            if not available:
+                raise KeysExhaustedError("사용 가능한 API 키가 없습니다 (한도 초과 또는 사용 불가)")
+            
+            now = time.monotonic()
+            key = min(available, key=lambda k: (max(k.next_at, now), k.used))
+            slot = max(key.next_at, now)
+            key.next_at = slot + self.min_interval
+            key.used += 1
+            self.unsaved += 1
+            save_due = (self.unsaved >= KEY_USAGE_SAVE_EVERY
+                        or now - self.saved_at >= KEY_USAGE_SAVE_SECONDS)
+        
+        if save_due:
+            self.save_usage()
+        
+        wait = slot - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        return key
+    
+    def mark_exhausted(self, key: ApiKey):
+        """오늘 한도를 모두 사용한 키로 표시"""
+        with self.lock:
+            key.used = self.daily_quota
+        self.save_usage()
+        logging.warning(f"API 키 {key.label} 일일 한도 초과, 다른 키로 전환")
+    
+    def mark_invalid(self, key: ApiKey):
+        """사용할 수 없는 키로 표시 (프로세스 종료 시까지)"""
+        with self.lock:
+            key.disabled = True
+        logging.error(f"API 키 {key.label} 사용 불가, 풀에서 제외")
+
+
 class DartCollector:
     def __init__(self, companies_csv: str = 'data/companies.csv'):
         print(f"\n📂 {companies_csv} 파일 읽기 중...")
-        self.companies_df = pd.read_csv(companies_csv)
+        # 고유번호/종목코드는 앞자리 0이 잘리지 않도록 문자열로 읽기
+        self.companies_df = pd.read_csv(companies_csv, dtype={'corp_code': str, 'stock_code': str})
         print(f"✓ 총 {len(self.companies_df)}개 기업 로드")
         
         # corp_code 컬럼명 확인 및 표준화
@@ -60,6 +198,8 @@ class DartCollector:
             print("  ℹ️ stock_code 컬럼을 발견, 이름 변경")
             self.companies_df['stock_code_original'] = self.companies_df['corp_code']
         
+        self.key_pool = ApiKeyPool(API_KEYS)
+        
         self.base_path = Path('data/raw')
         self.base_path.mkdir(parents=True, exist_ok=True)
         
@@ -81,15 +221,43 @@ class DartCollector:
         with open(self.progress_file, 'w', encoding='utf-8') as f:
             json.dump(self.progress, f, indent=2, ensure_ascii=False)
     
+    @staticmethod
+    def response_status(response: requests.Response) -> Optional[str]:
+        """DART 응답의 status 코드 추출 (JSON/XML 오류 응답, ZIP 본문이면 None)"""
+        if response.status_code != 200 or response.content[:2] == b'PK':
+            return None
+        try:
+            return response.json().get('status')
+        except ValueError:
+            pass
+        try:
+            return ET.fromstring(response.content).findtext('status')
+        except ET.ParseError:
+            return None
+    
+    def request(self, url: str, params: Dict, timeout: int = 30) -> requests.Response:
+        """키 풀에서 키를 골라 요청 (키 한도 초과/사용 불가 시 다른 키로 재시도)"""
+        while True:
+            key = self.key_pool.acquire()
+            response = requests.get(url, params={**params, 'crtfc_key': key.key}, timeout=timeout)
+            
+            status = self.response_status(response)
+            if status in KEY_QUOTA_STATUS:
+                self.key_pool.mark_exhausted(key)
+                continue
+            if status in KEY_INVALID_STATUS:
+                self.key_pool.mark_invalid(key)
+                continue
+            
+            return response
+    
     def get_corp_code(self, corp_name: str) -> Optional[str]:
         """
         회사명으로 DART 고유번호 조회 (API 직접 호출)
         """
         try:
             url = f"{BASE_URL}/corpCode.xml"
-            params = {'crtfc_key': API_KEY}
-            
-            response = requests.get(url, params=params, timeout=30)
+            response = self.request(url, {}, timeout=30)
             
             if response.status_code != 200:
                 logging.error(f"API 요청 실패: {response.status_code}")
@@ -117,6 +285,8 @@ class DartCollector:
             logging.warning(f"기업 '{corp_name}' 조회 결과 없음")
             return None
             
+        except KeysExhaustedError:
+            raise
         except Exception as e:
             logging.error(f"기업 '{corp_name}' 조회 오류: {e}")
             return None
@@ -126,11 +296,10 @@ class DartCollector:
         try:
             url = f"{BASE_URL}/company.json"
             params = {
-                'crtfc_key': API_KEY,
                 'corp_code': corp_code
             }
             
-            response = requests.get(url, params=params, timeout=30)
+            response = self.request(url, params, timeout=30)
             
             if response.status_code != 200:
                 logging.error(f"{corp_name} 개황 조회 실패: HTTP {response.status_code}")
@@ -145,6 +314,8 @@ class DartCollector:
             
             return data
             
+        except KeysExhaustedError:
+            raise
         except Exception as e:
             logging.error(f"{corp_name} 개황 조회 오류: {e}")
             return None
@@ -167,6 +338,8 @@ class DartCollector:
             logging.info(f"✓ {corp_name} 개황 저장 완료")
             return True
             
+        except KeysExhaustedError:
+            raise
         except Exception as e:
             logging.error(f"{corp_name} 개황 수집 오류: {e}")
             return False
@@ -176,14 +349,13 @@ class DartCollector:
         try:
             url = f"{BASE_URL}/list.json"
             params = {
-                'crtfc_key': API_KEY,
                 'corp_code': corp_code,
                 'bgn_de': bgn_de,
                 'end_de': end_de,
                 'page_count': 100
             }
             
-            response = requests.get(url, params=params, timeout=30)
+            response = self.request(url, params, timeout=30)
             
             if response.status_code != 200:
                 return []
@@ -195,6 +367,8 @@ class DartCollector:
             
             return data.get('list', [])
             
+        except KeysExhaustedError:
+            raise
         except Exception as e:
             logging.error(f"공시 목록 조회 오류: {e}")
             return []
@@ -204,11 +378,10 @@ class DartCollector:
         try:
             url = f"{BASE_URL}/document.xml"
             params = {
-                'crtfc_key': API_KEY,
                 'rcept_no': rcept_no
             }
             
-            response = requests.get(url, params=params, timeout=60)
+            response = self.request(url, params, timeout=60)
             
             if response.status_code != 200:
                 return False
@@ -220,84 +393,177 @@ class DartCollector:
             
             return True
             
+        except KeysExhaustedError:
+            raise
         except Exception as e:
             logging.error(f"문서 다운로드 오류: {e}")
             return False
     
+    @staticmethod
+    def match_report_type(report_nm: str) -> Optional[str]:
+        """보고서명에 해당하는 정기보고서 타입 반환 (없으면 None)"""
+        for report_type, keywords in REPORT_TYPES.items():
+            if any(keyword in report_nm for keyword in keywords):
+                return report_type
+        return None
+    
+    def filing_save_path(self, corp_code: str, year: str, rcept_no: str, report_nm: str) -> Path:
+        """공시 문서 저장 경로 생성"""
+        save_dir = self.base_path / 'filings' / corp_code / year
+        # 파일명을 보고서명으로 생성 (안전한 파일명으로 변환)
+        safe_report_nm = report_nm.replace('/', '_').replace('\\', '_')
+        filename = f"{year}_{rcept_no}_{safe_report_nm[:30]}.xml"
+        return save_dir / filename
+    
+    def amendment_key(self, report_nm: str) -> Optional[str]:
+        """정정 여부와 무관하게 같은 보고서를 가리키는 키 (예: '사업보고서 2023.12')"""
+        report_type = self.match_report_type(report_nm)
+        period = PERIOD_PATTERN.search(report_nm)
+        if not report_type or not period:
+            return None
+        return f"{report_type} {period.group(1)}"
+    
+    def record_amendments(self, corp_code: str, filings: List[Dict]) -> Dict[str, str]:
+        """
+        보고서별로 가장 최근 접수번호만 유효로 보고 대체된 접수번호를 메타데이터에 기록
+        반환: 지금까지 대체된 것으로 확인된 접수번호 → 해당 보고서의 유효 접수번호
+        """
+        path = self.base_path / 'filings' / corp_code / 'amendments.json'
+        amendments = {}
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                amendments = json.load(f)
+        
+        for filing in filings:
+            key = self.amendment_key(filing.get('report_nm', ''))
+            if not key:
+                continue
+            
+            rcept_no = filing['rcept_no']
+            entry = amendments.setdefault(key, {'effective': rcept_no, 'superseded': []})
+            if rcept_no == entry['effective'] or rcept_no in entry['superseded']:
+                continue
+            
+            # 접수번호가 더 큰(나중에 접수된) 보고서가 이전 보고서를 대체
+            if rcept_no > entry['effective']:
+                entry['superseded'].append(entry['effective'])
+                entry['effective'] = rcept_no
+            else:
+                entry['superseded'].append(rcept_no)
+            entry['superseded'].sort()
+        
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(amendments, f, indent=2, ensure_ascii=False)
+        
+        return {
+            rcept_no: entry['effective']
+            for entry in amendments.values() for rcept_no in entry['superseded']
+        }
+    
+    def filing_stored(self, corp_code: str, rcept_no: str) -> bool:
+        """접수번호의 공시 문서가 이미 저장되어 있는지 확인"""
+        corp_dir = self.base_path / 'filings' / corp_code
+        return next(corp_dir.glob(f'*/*_{rcept_no}_*.xml'), None) is not None
+    
     def collect_filings(self, corp_code: str, corp_name: str, 
-                       years: List[str] = ['2022', '2023', '2024']):
-        """정기공시 문서 수집"""
+                       years: List[str] = ['2022', '2023', '2024'],
+                       latest_only: bool = False):
+        """
+        정기공시 문서 수집
+        latest_only=True면 정정공시가 있는 보고서는 최종 정정본만 다운로드
+        """
         results = []
         
+        # 해당 연도의 모든 공시 조회
+        filings_by_year = {
+            year: self.get_filings_list(
+                corp_code=corp_code,
+                bgn_de=f'{year}0101',
+                end_de=f'{year}1231'
+            )
+            for year in years
+        }
+        
+        # 연도/보고서 타입별 대상 공시
+        targets = []
         for year in years:
+            all_filings = filings_by_year[year]
+            
+            if not all_filings:
+                logging.info(f"  {corp_name} {year}: 공시 없음")
+                continue
+            
+            # 보고서 타입별로 필터링
+            for report_type, keywords in REPORT_TYPES.items():
+                # 키워드에 매칭되는 공시 필터링
+                matched_filings = [
+                    f for f in all_filings 
+                    if any(keyword in f.get('report_nm', '') for keyword in keywords)
+                ]
+                
+                if not matched_filings:
+                    logging.info(f"  {corp_name} {year} {report_type}: 없음")
+                    continue
+                
+                logging.info(f"  {corp_name} {year} {report_type}: {len(matched_filings)}건 발견")
+                targets.extend((year, report_type, f) for f in matched_filings)
+        
+        # 정정공시는 원본과 접수 연도가 다를 수 있어 전체 연도를 합쳐서 판단
+        # 최신 접수분부터 처리해 유효 보고서가 저장된 뒤에만 이전 보고서를 건너뜀
+        superseded = {}
+        if latest_only:
+            superseded = self.record_amendments(corp_code, [f for _, _, f in targets])
+            targets.sort(key=lambda t: t[2]['rcept_no'], reverse=True)
+        covered = set()  # 어느 한 버전이라도 저장된 보고서 (amendment_key)
+        
+        # 각 공시 문서 다운로드
+        for year, report_type, filing in targets:
             try:
-                # API 호출 제한 준수
-                time.sleep(0.5)
+                rcept_no = filing['rcept_no']
+                report_nm = filing['report_nm']
+                amendment = self.amendment_key(report_nm)
+                
+                # 더 최근 버전이 저장되어 있을 때만 제외 (최신본 다운로드 실패 시 이전 버전으로 대체)
+                if rcept_no in superseded and (
+                    amendment in covered or self.filing_stored(corp_code, superseded[rcept_no])
+                ):
+                    logging.info(f"    정정으로 대체됨: {report_nm}")
+                    continue
                 
-                # 해당 연도의 모든 공시 조회
-                all_filings = self.get_filings_list(
-                    corp_code=corp_code,
-                    bgn_de=f'{year}0101',
-                    end_de=f'{year}1231'
-                )
+                save_path = self.filing_save_path(corp_code, year, rcept_no, report_nm)
+                filename = save_path.name
                 
-                if not all_filings:
-                    logging.info(f"  {corp_name} {year}: 공시 없음")
+                # 이미 다운로드했으면 스킵
+                if save_path.exists():
+                    logging.info(f"    이미 존재: {filename}")
+                    covered.add(amendment)
                     continue
                 
-                # 보고서 타입별로 필터링
-                for report_type, keywords in REPORT_TYPES.items():
-                    # 키워드에 매칭되는 공시 필터링
-                    matched_filings = [
-                        f for f in all_filings 
-                        if any(keyword in f.get('report_nm', '') for keyword in keywords)
-                    ]
-                    
-                    if not matched_filings:
-                        logging.info(f"  {corp_name} {year} {report_type}: 없음")
-                        continue
-                    
-                    logging.info(f"  {corp_name} {year} {report_type}: {len(matched_filings)}건 발견")
-                    
-                    # 각 공시 문서 다운로드
-                    for filing in matched_filings:
-                        rcept_no = filing['rcept_no']
-                        report_nm = filing['report_nm']
-                        
-                        save_dir = self.base_path / 'filings' / corp_code / year
-                        # 파일명을 보고서명으로 생성 (안전한 파일명으로 변환)
-                        safe_report_nm = report_nm.replace('/', '_').replace('\\', '_')
-                        filename = f"{year}_{rcept_no}_{safe_report_nm[:30]}.xml"
-                        save_path = save_dir / filename
-                        
-                        # 이미 다운로드했으면 스킵
-                        if save_path.exists():
-                            logging.info(f"    이미 존재: {filename}")
-                            continue
-                        
-                        # 원문 다운로드
-                        time.sleep(0.5)
-                        
-                        if self.download_filing(rcept_no, save_path):
-                            results.append({
-                                'corp_name': corp_name,
-                                'year': year,
-                                'report_type': report_type,
-                                'report_nm': report_nm,
-                                'rcept_no': rcept_no,
-                                'path': str(save_path)
-                            })
-                            logging.info(f"    ✓ {report_nm} 저장")
-                        else:
-                            logging.warning(f"    ✗ {report_nm} 다운로드 실패")
+                # 원문 다운로드
+                if self.download_filing(rcept_no, save_path):
+                    covered.add(amendment)
+                    results.append({
+                        'corp_name': corp_name,
+                        'year': year,
+                        'report_type': report_type,
+                        'report_nm': report_nm,
+                        'rcept_no': rcept_no,
+                        'path': str(save_path)
+                    })
+                    logging.info(f"    ✓ {report_nm} 저장")
+                else:
+                    logging.warning(f"    ✗ {report_nm} 다운로드 실패")
                 
+            except KeysExhaustedError:
+                raise
             except Exception as e:
-                logging.error(f"  {corp_name} {year} 오류: {e}")
+                logging.error(f"  {corp_name} {year} {filing.get('report_nm')} 오류: {e}")
                 continue
         
         return results
     
-    def collect_all(self):
+    def collect_all(self, latest_only: bool = False):
         """전체 기업 데이터 수집"""
         total = len(self.companies_df)
         
@@ -341,7 +607,7 @@ class DartCollector:
                 
                 # 정기공시 수집
                 print(f"  📄 정기공시 수집 중...")
-                filings = self.collect_filings(corp_code, corp_name)
+                filings = self.collect_filings(corp_code, corp_name, latest_only=latest_only)
                 
                 # 성공 기록
                 self.progress['completed'].append(corp_name)
@@ -355,6 +621,13 @@ class DartCollector:
                 print(f"진행 상황 저장 완료: {len(self.progress['completed'])}개 완료")
                 return
                 
+            except KeysExhaustedError as e:
+                # 현재 기업은 실패로 기록하지 않고 중단 (다음 실행 시 이어서 수집)
+                print(f"\n\n⚠️ 오늘 API 요청 한도를 모두 사용했습니다: {e}")
+                self.save_progress()
+                print(f"진행 상황 저장 완료: {len(self.progress['completed'])}개 완료 (내일 다시 실행하세요)")
+                return
+                
             except Exception as e:
                 logging.error(f"✗✗✗ {corp_name} 실패: {e}")
                 self.progress['failed'].append({
@@ -381,11 +654,217 @@ class DartCollector:
                 print(f"  ... 외 {len(self.progress['failed']) - 10}개")
         
         print(f"{'='*60}\n")
+    
+    def load_watch_state(self) -> Dict:
+        """감시 모드 상태(하이워터마크) 로드"""
+        if WATCH_STATE_FILE.exists():
+            with open(WATCH_STATE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        # 최초 실행: 오늘 접수분부터 감시 (과거분은 collect_all로 수집)
+        return {'last_rcept_dt': datetime.now().strftime('%Y%m%d'), 'last_rcept_no': ''}
+    
+    def save_watch_state(self, state: Dict):
+        """감시 모드 상태 저장"""
+        WATCH_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(WATCH_STATE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2, ensure_ascii=False)
+    
+    def tracked_corp_codes(self) -> set:
+        """감시 대상 기업 고유번호 (앞자리 0 없이 저장된 CSV도 8자리로 맞춤)"""
+        return {
+            str(code).strip().zfill(8)
+            for code in self.companies_df['corp_code'].dropna()
+        }
+    
+    def get_recent_filings(self, bgn_de: str, end_de: str, page_no: int = 1) -> Dict:
+        """전체 기업 정기공시 목록 조회 (최신순, 한 페이지)"""
+        try:
+            url = f"{BASE_URL}/list.json"
+            params = {
+                'bgn_de': bgn_de,
+                'end_de': end_de,
+                'pblntf_ty': 'A',
+                'sort': 'date',
+                'sort_mth': 'desc',
+                'page_no': page_no,
+                'page_count': 100
+            }
+            
+            response = self.request(url, params, timeout=30)
+            
+            if response.status_code != 200:
+                logging.error(f"최근 공시 목록 조회 실패: HTTP {response.status_code}")
+                return {}
+            
+            data = response.json()
+            
+            # 013: 조회된 데이터 없음
+            if data.get('status') not in ('000', '013'):
+                logging.error(f"최근 공시 목록 조회 실패: {data.get('message')}")
+                return {}
+            
+            return data
+            
+        except KeysExhaustedError:
+            raise
+        except Exception as e:
+            logging.error(f"최근 공시 목록 조회 오류: {e}")
+            return {}
+    
+    def poll_new_filings(self, state: Dict) -> Tuple[List[Dict], Optional[Dict]]:
+        """
+        하이워터마크 이후 접수된 감시 대상 기업의 정기공시 조회 (오래된 순)
+        반환: (감시 대상 신규 공시, 조회한 공시 중 가장 최근 공시의 접수일자/접수번호)
+        목록 조회가 중간에 실패하면 누락을 막기 위해 ([], None) 반환
+        """
+        today = datetime.now()
+        bgn_de = state['last_rcept_dt']
+        oldest_de = (today - timedelta(days=WATCH_MAX_DAYS - 1)).strftime('%Y%m%d')
+        if bgn_de < oldest_de:
+            logging.warning(f"감시 중단 기간이 길어 {oldest_de} 이후만 조회합니다 (누락분은 collect_all로 보완)")
+            bgn_de = oldest_de
+        end_de = today.strftime('%Y%m%d')
+        
+        tracked = self.tracked_corp_codes()
+        last_rcept_no = state['last_rcept_no']
+        # 페이지 조회 사이에 새 공시가 접수되면 다음 페이지에 같은 공시가 다시 나오므로 접수번호로 중복 제거
+        new_filings = {}
+        newest = None
+        page_no = 1
+        
+        while True:
+            data = self.get_recent_filings(bgn_de, end_de, page_no)
+            if not data:
+                return [], None
+            filings = data.get('list', [])
+            
+            reached_mark = False
+            for filing in filings:
+                # 접수번호는 접수일자+일련번호라 문자열 비교로 선후 판단 가능
+                if filing['rcept_no'] <= last_rcept_no:
+                    reached_mark = True
+                    break
+                if newest is None:
+                    newest = {'last_rcept_dt': filing['rcept_dt'], 'last_rcept_no': filing['rcept_no']}
+                if filing.get('corp_code') in tracked and self.match_report_type(filing.get('report_nm', '')):
+                    new_filings[filing['rcept_no']] = filing
+            
+            # 최신순 정렬이므로 이미 처리한 접수번호를 만나면 이후 페이지는 볼 필요 없음
+            if reached_mark or page_no >= int(data.get('total_page', 1) or 1):
+                break
+            
+            page_no += 1
+        
+        return sorted(new_filings.values(), key=lambda f: f['rcept_no']), newest
+    
+    def watch_once(self, state: Dict, handlers: List[Callable[[Dict], None]],
+                   latest_only: bool = False):
+        """감시 모드 한 주기: 신규 공시 조회 → 다운로드 → 후속 처리 → 하이워터마크 갱신"""
+        new_filings, newest = self.poll_new_filings(state)
+        failed = False
+        
+        if new_filings:
+            logging.info(f"신규 정기공시 {len(new_filings)}건 발견")
+        
+        superseded = {}
+        if latest_only:
+            for corp_code in {f['corp_code'] for f in new_filings}:
+                superseded.update(self.record_amendments(
+                    corp_code, [f for f in new_filings if f['corp_code'] == corp_code]
+                ))
+        
+        for filing in new_filings:
+            corp_code = filing['corp_code']
+            rcept_no = filing['rcept_no']
+            report_nm = filing['report_nm']
+            year = filing['rcept_dt'][:4]
+            save_path = self.filing_save_path(corp_code, year, rcept_no, report_nm)
+            
+            # 정정으로 대체된 보고서는 다운로드하지 않음
+            if rcept_no in superseded:
+                logging.info(f"    정정으로 대체됨: {filing['corp_name']} {report_nm}")
+                continue
+            
+            if not save_path.exists():
+                if not self.download_filing(rcept_no, save_path):
+                    # 실패한 공시 바로 앞까지만 하이워터마크를 올리고 다음 주기에 재시도
+                    logging.warning(f"    ✗ {filing['corp_name']} {report_nm} 다운로드 실패 (다음 주기 재시도)")
+                    state['last_rcept_dt'] = filing['rcept_dt']
+                    state['last_rcept_no'] = str(int(rcept_no) - 1).zfill(len(rcept_no))
+                    self.save_watch_state(state)
+                    failed = True
+                    break
+                logging.info(f"    ✓ {filing['corp_name']} {report_nm} 저장")
+            
+            result = {
+                'corp_code': corp_code,
+                'corp_name': filing['corp_name'],
+                'year': year,
+                'report_type': self.match_report_type(report_nm),
+                'report_nm': report_nm,
+                'rcept_no': rcept_no,
+                'path': str(save_path)
+            }
+            for handler in handlers:
+                try:
+                    handler(result)
+                except Exception as e:
+                    logging.error(f"후속 처리 오류 ({rcept_no}): {e}")
+            
+            state['last_rcept_dt'] = filing['rcept_dt']
+            state['last_rcept_no'] = rcept_no
+            self.save_watch_state(state)
+        
+        # 모두 처리했으면 감시 대상이 아닌 공시까지 포함해 조회한 최신 접수번호로 이동
+        # (조용한 기간에는 다음 폴링이 첫 페이지 한 번으로 끝남)
+        if not failed and newest and newest['last_rcept_no'] > state['last_rcept_no']:
+            state.update(newest)
+            self.save_watch_state(state)
+    
+    def watch(self, interval: int = WATCH_INTERVAL,
+              handlers: Optional[List[Callable[[Dict], None]]] = None,
+              latest_only: bool = False):
+        """
+        감시 모드: 주기적으로 신규 정기공시를 폴링하여 다운로드
+        다운로드한 공시는 handlers에 순서대로 전달 (후속 처리 단계 연결용)
+        latest_only=True면 같은 주기에 원본과 정정본이 함께 들어온 경우 정정본만 다운로드
+        """
+        handlers = handlers or []
+        state = self.load_watch_state()
+        # 최초 실행 기준점도 바로 저장 (재시작 시 그 사이 공시를 건너뛰지 않도록)
+        self.save_watch_state(state)
+        
+        print(f"\n{'='*60}")
+        print(f"👀 감시 모드 시작 (주기 {interval}초, 기준: {state['last_rcept_dt']} {state['last_rcept_no'] or '-'})")
+        print(f"{'='*60}\n")
+        
+        try:
+            while True:
+                try:
+                    self.watch_once(state, handlers, latest_only)
+                except KeysExhaustedError as e:
+                    # 하이워터마크는 마지막으로 처리한 공시에 머무르므로 다음 주기에 이어서 처리
+                    logging.warning(f"{e} - 다음 주기에 재시도")
+                
+                time.sleep(interval)
+                
+        except KeyboardInterrupt:
+            print("\n\n⚠️ 사용자가 감시 모드를 중단했습니다")
+            self.save_watch_state(state)
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='DART 정기공시 수집')
+    parser.add_argument('--watch', action='store_true', help='신규 공시 감시 모드로 실행')
+    parser.add_argument('--interval', type=int, default=WATCH_INTERVAL, help='감시 모드 폴링 주기 (초)')
+    parser.add_argument('--latest-only', action='store_true', help='정정공시가 있으면 최종 정정본만 수집')
+    args = parser.parse_args()
+    
     try:
         collector = DartCollector()
-        collector.collect_all()
+        if args.watch:
+            collector.watch(interval=args.interval, latest_only=args.latest_only)
+        else:
+            collector.collect_all(latest_only=args.latest_only)
     except Exception as e:
         print(f"\n❌ 치명적 오류: {e}")
         import traceback
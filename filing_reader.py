@@ -0,0 +1,175 @@
+"""
+저장된 공시 문서(ZIP) 부분 읽기
+전체를 압축 해제하지 않고 중앙 디렉터리로 파일 목록을 보고, 필요한 파일만 압축 해제
+
+  reader = FilingReader()
+  reader.members('20240312000736')          # 본문 + 첨부 파일 목록
+  reader.read_member('20240312000736')      # 본문만 압축 해제
+  with reader.open_member('20240312000736', '20240312000736_00760.xml') as stream:
+      ...                                   # 첨부 파일 스트리밍
+"""
+import mmap
+import threading
+import zipfile
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Callable, Dict, Iterator, List, Optional
+
+FILINGS_PATH = Path('data/raw/filings')
+
+MAX_OPEN_ARCHIVES = 32               # 동시에 열어둘 ZIP 파일 수
+MEMBER_CACHE_BYTES = 64 * 1024 * 1024  # 압축 해제된 파일 캐시 용량
+
+
+class MappedFile(mmap.mmap):
+    """zipfile이 요구하는 seekable()을 추가한 읽기 전용 mmap (Python 3.13 미만 호환)"""
+    def seekable(self) -> bool:
+        return True
+
+
+class OpenArchive:
+    """열린 ZIP 하나 (읽는 중인 스레드 수를 세어 다 읽은 뒤에만 닫음)"""
+    def __init__(self, f: IO[bytes], mm: MappedFile, zf: zipfile.ZipFile):
+        self.f = f
+        self.mm = mm
+        self.zf = zf
+        self.refs = 0
+        self.evicted = False
+
+    def close(self):
+        self.zf.close()
+        self.mm.close()
+        self.f.close()
+
+
+class FilingReader:
+    """
+    접수번호(rcept_no)로 저장된 공시 ZIP을 메모리 매핑해 필요한 파일만 읽기
+    locate를 주면 접수번호 → 경로 조회에 사용 (없으면 data/raw/filings를 직접 스캔)
+    """
+    def __init__(self, locate: Optional[Callable[[str], Optional[str]]] = None,
+                 filings_path: Path = FILINGS_PATH,
+                 max_open: int = MAX_OPEN_ARCHIVES,
+                 cache_bytes: int = MEMBER_CACHE_BYTES):
+        self.locate = locate or self.find_path
+        self.filings_path = filings_path
+        self.max_open = max_open
+        self.cache_bytes = cache_bytes
+        self.lock = threading.Lock()
+
+        self.paths: Dict[str, Path] = {}
+        self.archives: "OrderedDict[str, OpenArchive]" = OrderedDict()
+        self.main_names: Dict[str, str] = {}                        # rcept_no → 본문 파일명
+        self.cache: "OrderedDict[tuple, bytes]" = OrderedDict()   # (rcept_no, 파일명) → 내용
+        self.cached_bytes = 0
+
+    def find_path(self, rcept_no: str) -> Optional[Path]:
+        """저장 경로 조회 ({corp_code}/{year}/{year}_{rcept_no}_{report_nm}.xml, 없으면 재스캔)"""
+        if rcept_no not in self.paths:
+            self.paths = {
+                path.stem.split('_', 2)[1]: path
+                for path in self.filings_path.glob('*/*/*_*_*.xml')
+            }
+        return self.paths.get(rcept_no)
+
+    def open_archive(self, rcept_no: str) -> OpenArchive:
+        """ZIP 열기 (중앙 디렉터리만 읽음, self.lock을 잡은 상태에서 호출)"""
+        path = self.locate(rcept_no)
+        if not path:
+            raise FileNotFoundError(f"공시 문서를 찾을 수 없습니다: {rcept_no}")
+
+        f = open(path, 'rb')
+        mm = None
+        try:
+            mm = MappedFile(f.fileno(), 0, access=mmap.ACCESS_READ)
+            zf = zipfile.ZipFile(mm)
+        except (ValueError, zipfile.BadZipFile):
+            # 빈 파일(mmap 불가)이거나 ZIP이 아닌 오류 응답이 저장된 경우
+            if mm is not None:
+                mm.close()
+            f.close()
+            raise zipfile.BadZipFile(f"ZIP 형식이 아닙니다: {path}")
+        return OpenArchive(f, mm, zf)
+
+    @contextmanager
+    def archive(self, rcept_no: str) -> Iterator[zipfile.ZipFile]:
+        """
+        ZIP을 빌려 쓰기 (최근 사용한 MAX_OPEN_ARCHIVES개 유지)
+        밀려난 ZIP도 읽는 중인 스레드가 있으면 다 읽은 뒤에 닫힘
+        """
+        with self.lock:
+            entry = self.archives.get(rcept_no)
+            if entry:
+                self.archives.move_to_end(rcept_no)
+            else:
+                entry = self.open_archive(rcept_no)
+                self.archives[rcept_no] = entry
+                while len(self.archives) > self.max_open:
+                    _, old = self.archives.popitem(last=False)
+                    old.evicted = True
+                    if old.refs == 0:
+                        old.close()
+            entry.refs += 1
+
+        try:
+            yield entry.zf
+        finally:
+            with self.lock:
+                entry.refs -= 1
+                if entry.evicted and entry.refs == 0:
+                    entry.close()
+
+    def members(self, rcept_no: str) -> List[Dict]:
+        """ZIP 안의 파일 목록 (이름, 원본 크기, 압축 크기)"""
+        with self.archive(rcept_no) as zf:
+            return [
+                {'name': info.filename, 'size': info.file_size, 'compressed_size': info.compress_size}
+                for info in zf.infolist()
+            ]
+
+    def main_member(self, rcept_no: str) -> str:
+        """본문 파일명 ({rcept_no}.xml, 없으면 첫 번째 파일)"""
+        if rcept_no not in self.main_names:
+            with self.archive(rcept_no) as zf:
+                names = zf.namelist()
+            self.main_names[rcept_no] = f'{rcept_no}.xml' if f'{rcept_no}.xml' in names else names[0]
+        return self.main_names[rcept_no]
+
+    @contextmanager
+    def open_member(self, rcept_no: str, name: Optional[str] = None) -> Iterator[IO[bytes]]:
+        """파일 하나를 스트림으로 열기 (캐시하지 않음, 큰 첨부 파일용)"""
+        name = name or self.main_member(rcept_no)
+        with self.archive(rcept_no) as zf, zf.open(name) as stream:
+            yield stream
+
+    def read_member(self, rcept_no: str, name: Optional[str] = None) -> bytes:
+        """파일 하나를 압축 해제해 반환 (MEMBER_CACHE_BYTES 이내에서 최근 사용분 캐시)"""
+        # 본문 파일명을 이미 알고 있으면 캐시 적중 시 ZIP을 열지 않음
+        key = (rcept_no, name or self.main_member(rcept_no))
+
+        with self.lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                return self.cache[key]
+
+        with self.open_member(*key) as stream:
+            data = stream.read()
+
+        with self.lock:
+            if key not in self.cache and len(data) <= self.cache_bytes:
+                self.cache[key] = data
+                self.cached_bytes += len(data)
+                while self.cached_bytes > self.cache_bytes:
+                    _, old = self.cache.popitem(last=False)
+                    self.cached_bytes -= len(old)
+        return data
+
+    def close(self):
+        """열린 ZIP 모두 닫기 (읽는 중인 ZIP은 다 읽은 뒤에 닫힘)"""
+        with self.lock:
+            for entry in self.archives.values():
+                entry.evicted = True
+                if entry.refs == 0:
+                    entry.close()
+            self.archives.clear()
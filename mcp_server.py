@@ -0,0 +1,473 @@
+"""
+DART 수집 데이터 조회 서버 (MCP 스타일 도구 엔드포인트)
+기업 목록, 공시 카탈로그, 임베딩 모델을 메모리에 올려두고 JSON-RPC로 응답
+
+  python mcp_server.py            # 서버 실행 (기본 127.0.0.1:8765)
+  python mcp_server.py --index    # 수집된 공시를 벡터 DB에 색인 후 종료
+
+요청 예시:
+  {"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+   "params": {"name": "lookup_company", "arguments": {"query": "삼성전자"}}}
+"""
+import re
+import json
+import html
+import time
+import queue
+import logging
+import inspect
+import argparse
+import threading
+import zipfile
+from concurrent.futures import Future
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+import chromadb
+from sentence_transformers import SentenceTransformer
+
+from filing_reader import FilingReader
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+# 데이터 경로
+DATA_PATH = Path('data')
+FILINGS_PATH = DATA_PATH / 'raw' / 'filings'
+CHROMA_PATH = DATA_PATH / 'chroma'
+
+# 임베딩/검색 설정
+EMBEDDING_MODEL = 'jhgan/ko-sroberta-multitask'
+COLLECTION_NAME = 'dart_sections'
+CHUNK_SIZE = 1000          # 색인 단위 (문자 수)
+BATCH_MAX_SIZE = 32        # 동시 질의 묶음 최대 크기
+BATCH_WAIT = 0.005         # 묶음을 모으는 최대 대기 시간 (초)
+
+# 캐시 설정
+QUERY_CACHE_SIZE = 1024    # 질의 임베딩 캐시
+DOCUMENT_CACHE_SIZE = 64   # 파싱된 문서 캐시 (압축 해제 원문은 FilingReader가 별도 캐시)
+CATALOG_REFRESH = 60       # 카탈로그 재스캔 최소 간격 (초, 감시 모드로 추가된 공시 반영)
+
+# 보고서 타입 정의 (data_collector.py와 동일)
+REPORT_TYPES = {
+    '사업보고서': ['사업보고서'],
+    '반기보고서': ['반기보고서'],
+    '분기보고서': ['분기보고서'],
+}
+
+# 도구별 입력 스키마 (JSON Schema, tools/list로 노출하고 tools/call 인자 검증에 사용)
+TOOL_SCHEMAS = {
+    'lookup_company': {
+        'type': 'object',
+        'properties': {
+            'query': {'type': 'string', 'description': '회사명 일부, 고유번호(8자리) 또는 종목코드(6자리)'},
+            'limit': {'type': 'integer', 'minimum': 1, 'default': 10},
+        },
+        'required': ['query'],
+        'additionalProperties': False,
+    },
+    'list_filings': {
+        'type': 'object',
+        'properties': {
+            'corp_code': {'type': 'string', 'description': 'DART 고유번호 (8자리)'},
+            'year': {'type': 'string', 'description': '접수 연도 (예: 2024)'},
+            'report_type': {'type': 'string', 'enum': list(REPORT_TYPES)},
+        },
+        'required': ['corp_code'],
+        'additionalProperties': False,
+    },
+    'get_section': {
+        'type': 'object',
+        'properties': {
+            'rcept_no': {'type': 'string', 'description': '접수번호 (14자리)'},
+            'title': {'type': 'string', 'description': '섹션 제목 (부분 일치, 생략하면 목차 반환)'},
+        },
+        'required': ['rcept_no'],
+        'additionalProperties': False,
+    },
+    'semantic_search': {
+        'type': 'object',
+        'properties': {
+            'query': {'type': 'string'},
+            'top_k': {'type': 'integer', 'minimum': 1, 'default': 5},
+            'corp_code': {'type': 'string', 'description': 'DART 고유번호로 검색 범위 제한'},
+        },
+        'required': ['query'],
+        'additionalProperties': False,
+    },
+}
+
+TITLE_PATTERN = re.compile(r'<TITLE[^>]*>(.*?)</TITLE>', re.S)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+SPACE_PATTERN = re.compile(r'\s+')
+
+
+def strip_tags(markup: str) -> str:
+    """태그 제거 후 공백 정리"""
+    return SPACE_PATTERN.sub(' ', html.unescape(TAG_PATTERN.sub(' ', markup))).strip()
+
+
+def validate_arguments(schema: Dict, arguments) -> Optional[str]:
+    """도구 인자를 입력 스키마로 검증 (문제가 없으면 None, 있으면 오류 메시지)"""
+    if not isinstance(arguments, dict):
+        return 'arguments는 객체여야 합니다'
+
+    properties = schema['properties']
+    missing = [name for name in schema.get('required', []) if name not in arguments]
+    if missing:
+        return f"필수 인자 누락: {', '.join(missing)}"
+    unknown = [name for name in arguments if name not in properties]
+    if unknown:
+        return f"알 수 없는 인자: {', '.join(unknown)}"
+
+    for name, value in arguments.items():
+        spec = properties[name]
+        if spec['type'] == 'string' and not isinstance(value, str):
+            return f"{name}은(는) 문자열이어야 합니다"
+        if spec['type'] == 'integer':
+            if not isinstance(value, int) or isinstance(value, bool):
+                return f"{name}은(는) 정수여야 합니다"
+            if value < spec.get('minimum', value):
+                return f"{name}은(는) {spec['minimum']} 이상이어야 합니다"
+        if 'enum' in spec and value not in spec['enum']:
+            return f"{name}은(는) {spec['enum']} 중 하나여야 합니다"
+    return None
+
+
+class CorpRegistry:
+    """기업 목록 (이름/고유번호/종목코드 조회)"""
+    def __init__(self):
+        frames = []
+        for csv in ('dart_listed_companies.csv', 'companies.csv'):
+            path = DATA_PATH / csv
+            if path.exists():
+                frames.append(pd.read_csv(path, dtype=str)[['corp_code', 'corp_name', 'stock_code']])
+
+        self.df = pd.concat(frames).dropna(subset=['corp_code']).drop_duplicates('corp_code')
+        self.df['corp_code'] = self.df['corp_code'].str.strip().str.zfill(8)
+        self.df['stock_code'] = self.df['stock_code'].fillna('').str.strip()
+        self.by_code = {row.corp_code: row._asdict() for row in self.df.itertuples(index=False)}
+        logging.info(f"✓ 기업 {len(self.df):,}개 로드")
+
+    def lookup(self, query: str, limit: int = 10) -> List[Dict]:
+        """회사명 일부, 고유번호 또는 종목코드로 기업 검색"""
+        query = query.strip()
+        if query in self.by_code:
+            return [self.by_code[query]]
+
+        exact = self.df[(self.df['corp_name'] == query) | (self.df['stock_code'] == query)]
+        partial = self.df[self.df['corp_name'].str.contains(query, na=False, regex=False)]
+        found = pd.concat([exact, partial]).drop_duplicates('corp_code').head(limit)
+        return [row._asdict() for row in found.itertuples(index=False)]
+
+
+class FilingCatalog:
+    """수집된 공시 문서 목록 (data/raw/filings/{corp_code}/{year}/{year}_{rcept_no}_{report_nm}.xml)"""
+    def __init__(self):
+        self.filings: Dict[str, Dict] = {}
+        self.scanned_at = 0.0
+        self.lock = threading.Lock()
+        self.refresh(force=True)
+
+    def refresh(self, force: bool = False):
+        """파일 시스템 재스캔 (CATALOG_REFRESH 간격 이내면 생략)"""
+        with self.lock:
+            if not force and time.monotonic() - self.scanned_at < CATALOG_REFRESH:
+                return
+
+            filings = {}
+            for path in FILINGS_PATH.glob('*/*/*.xml'):
+                parts = path.stem.split('_', 2)
+                if len(parts) != 3:
+                    continue
+                year, rcept_no, report_nm = parts
+                filings[rcept_no] = {
+                    'corp_code': path.parent.parent.name,
+                    'year': year,
+                    'rcept_no': rcept_no,
+                    'report_nm': report_nm,
+                    'report_type': next(
+                        (t for t, kws in REPORT_TYPES.items() if any(kw in report_nm for kw in kws)),
+                        None
+                    ),
+                    'path': str(path)
+                }
+
+            self.filings = filings
+            self.scanned_at = time.monotonic()
+
+    def get(self, rcept_no: str) -> Optional[Dict]:
+        """접수번호로 공시 조회 (없으면 재스캔 후 한 번 더 확인)"""
+        if rcept_no not in self.filings:
+            self.refresh()
+        return self.filings.get(rcept_no)
+
+    def list(self, corp_code: str, year: Optional[str] = None,
+             report_type: Optional[str] = None) -> List[Dict]:
+        """기업별 공시 목록 (최신순)"""
+        self.refresh()
+        found = [
+            f for f in self.filings.values()
+            if f['corp_code'] == corp_code
+            and (year is None or f['year'] == year)
+            and (report_type is None or f['report_type'] == report_type)
+        ]
+        return sorted(found, key=lambda f: f['rcept_no'], reverse=True)
+
+
+def parse_sections(raw: bytes) -> tuple:
+    """공시 본문을 (제목, 본문) 섹션 목록으로 파싱"""
+    try:
+        markup = raw.decode('utf-8')
+    except UnicodeDecodeError:
+        markup = raw.decode('euc-kr', errors='replace')
+
+    # re.split 결과: [머리말, 제목1, 본문1, 제목2, 본문2, ...]
+    parts = TITLE_PATTERN.split(markup)
+    return tuple(
+        (strip_tags(parts[i]), strip_tags(parts[i + 1]))
+        for i in range(1, len(parts) - 1, 2)
+    )
+
+
+class EmbeddingBatcher:
+    """동시에 들어온 질의를 묶어서 한 번에 임베딩"""
+    def __init__(self, model: SentenceTransformer):
+        self.model = model
+        self.queue: "queue.Queue[tuple]" = queue.Queue()
+        threading.Thread(target=self.run, daemon=True).start()
+
+    def run(self):
+        while True:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + BATCH_WAIT
+            while len(batch) < BATCH_MAX_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            texts = [text for text, _ in batch]
+            try:
+                vectors = self.model.encode(texts, normalize_embeddings=True).tolist()
+                for (_, future), vector in zip(batch, vectors):
+                    future.set_result(vector)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+
+    def encode(self, text: str) -> List[float]:
+        future: Future = Future()
+        self.queue.put((text, future))
+        return future.result()
+
+
+class RetrievalService:
+    """도구 구현 (기업 조회, 공시 목록, 섹션 조회, 의미 검색)"""
+    def __init__(self):
+        self.registry = CorpRegistry()
+        self.catalog = FilingCatalog()
+        self.reader = FilingReader(locate=lambda rcept_no: (self.catalog.get(rcept_no) or {}).get('path'))
+        self.load_sections = lru_cache(maxsize=DOCUMENT_CACHE_SIZE)(self.read_sections)
+        logging.info(f"✓ 공시 {len(self.catalog.filings):,}건 로드")
+
+        logging.info(f"임베딩 모델 로드 중: {EMBEDDING_MODEL}")
+        self.model = SentenceTransformer(EMBEDDING_MODEL)
+        self.batcher = EmbeddingBatcher(self.model)
+        self.collection = chromadb.PersistentClient(path=str(CHROMA_PATH)).get_or_create_collection(
+            COLLECTION_NAME, metadata={'hnsw:space': 'cosine'}
+        )
+        logging.info(f"✓ 벡터 DB 로드 ({self.collection.count():,}개 청크)")
+
+        self.embed_query = lru_cache(maxsize=QUERY_CACHE_SIZE)(self.batcher.encode)
+        self.tools = {
+            'lookup_company': self.lookup_company,
+            'list_filings': self.list_filings,
+            'get_section': self.get_section,
+            'semantic_search': self.semantic_search,
+        }
+
+    def read_sections(self, rcept_no: str) -> tuple:
+        """본문 파일만 압축 해제해 섹션 파싱 (ZIP이 아닌 파일은 그대로 읽음)"""
+        try:
+            raw = self.reader.read_member(rcept_no)
+        except zipfile.BadZipFile:
+            raw = Path(self.catalog.get(rcept_no)['path']).read_bytes()
+        return parse_sections(raw)
+
+    def lookup_company(self, query: str, limit: int = 10) -> List[Dict]:
+        """회사명 일부, 고유번호 또는 종목코드로 기업 검색"""
+        return self.registry.lookup(query, limit)
+
+    def list_filings(self, corp_code: str, year: Optional[str] = None,
+                     report_type: Optional[str] = None) -> List[Dict]:
+        """기업 고유번호로 수집된 공시 목록 조회 (연도/보고서 타입 필터)"""
+        return self.catalog.list(corp_code, year, report_type)
+
+    def get_section(self, rcept_no: str, title: Optional[str] = None) -> Dict:
+        """title이 없으면 목차, 있으면 제목이 일치(부분 포함)하는 섹션 본문 반환"""
+        filing = self.catalog.get(rcept_no)
+        if not filing:
+            raise ValueError(f"공시를 찾을 수 없습니다: {rcept_no}")
+
+        sections = self.load_sections(rcept_no)
+        if title is None:
+            return {'rcept_no': rcept_no, 'titles': [t for t, _ in sections]}
+
+        for section_title, text in sections:
+            if title in section_title:
+                return {'rcept_no': rcept_no, 'title': section_title, 'text': text}
+        raise ValueError(f"섹션을 찾을 수 없습니다: {title}")
+
+    def semantic_search(self, query: str, top_k: int = 5,
+                        corp_code: Optional[str] = None) -> List[Dict]:
+        """질의와 의미가 가까운 공시 본문 청크 검색"""
+        result = self.collection.query(
+            query_embeddings=[self.embed_query(query)],
+            n_results=top_k,
+            where={'corp_code': corp_code} if corp_code else None,
+        )
+        return [
+            {**meta, 'text': doc, 'score': 1 - dist}
+            for meta, doc, dist in zip(result['metadatas'][0], result['documents'][0], result['distances'][0])
+        ]
+
+    def index_filings(self) -> int:
+        """색인되지 않은 공시를 섹션 청크 단위로 벡터 DB에 추가"""
+        added = 0
+        for rcept_no, filing in self.catalog.filings.items():
+            if self.collection.get(where={'rcept_no': rcept_no}, limit=1)['ids']:
+                continue
+
+            ids, docs, metas = [], [], []
+            for s_idx, (title, text) in enumerate(self.load_sections(rcept_no)):
+                for c_idx in range(0, len(text), CHUNK_SIZE):
+                    ids.append(f'{rcept_no}-{s_idx}-{c_idx // CHUNK_SIZE}')
+                    docs.append(f'{title}\n{text[c_idx:c_idx + CHUNK_SIZE]}')
+                    metas.append({
+                        'corp_code': filing['corp_code'],
+                        'rcept_no': rcept_no,
+                        'report_nm': filing['report_nm'],
+                        'title': title
+                    })
+            if not ids:
+                continue
+
+            embeddings = self.model.encode(docs, batch_size=BATCH_MAX_SIZE, normalize_embeddings=True).tolist()
+            self.collection.add(ids=ids, documents=docs, metadatas=metas, embeddings=embeddings)
+            added += len(ids)
+            logging.info(f"  ✓ {filing['report_nm']} ({rcept_no}) {len(ids)}개 청크 색인")
+
+        return added
+
+
+class ToolHandler(BaseHTTPRequestHandler):
+    """JSON-RPC 2.0 (tools/list, tools/call) 요청 처리"""
+    service: RetrievalService = None
+
+    def do_POST(self):
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+        except ValueError:
+            return self.send_json({'jsonrpc': '2.0', 'id': None,
+                                   'error': {'code': -32700, 'message': 'Parse error'}})
+
+        # 배치(배열)나 문자열/숫자 등 객체가 아닌 요청은 지원하지 않음
+        if not isinstance(request, dict):
+            return self.send_json({'jsonrpc': '2.0', 'id': None,
+                                   'error': {'code': -32600, 'message': 'Invalid Request'}})
+
+        response = {'jsonrpc': '2.0', 'id': request.get('id')}
+        method = request.get('method')
+        params = request.get('params') or {}
+
+        if method == 'tools/list':
+            response['result'] = {'tools': [
+                {
+                    'name': name,
+                    'description': (tool.__doc__ or '').strip(),
+                    'inputSchema': TOOL_SCHEMAS[name]
+                }
+                for name, tool in self.service.tools.items()
+            ]}
+        elif method == 'tools/call':
+            response.update(self.call_tool(params))
+        else:
+            response['error'] = {'code': -32601, 'message': f'Method not found: {method}'}
+
+        self.send_json(response)
+
+    def call_tool(self, params) -> Dict:
+        """인자를 스키마/시그니처로 먼저 검증하고, 도구 내부 오류는 -32603으로 구분"""
+        if not isinstance(params, dict) or params.get('name') not in self.service.tools:
+            name = params.get('name') if isinstance(params, dict) else None
+            return {'error': {'code': -32602, 'message': f'Unknown tool: {name}'}}
+
+        name = params['name']
+        tool = self.service.tools[name]
+        arguments = params.get('arguments') or {}
+
+        problem = validate_arguments(TOOL_SCHEMAS[name], arguments)
+        if problem is None:
+            try:
+                inspect.signature(tool).bind(**arguments)
+            except TypeError as e:
+                problem = str(e)
+        if problem:
+            return {'error': {'code': -32602, 'message': f'Invalid params: {problem}'}}
+
+        try:
+            return {'result': tool(**arguments)}
+        except Exception as e:
+            logging.error(f"도구 실행 오류 ({name}): {e}")
+            return {'error': {'code': -32603, 'message': str(e)}}
+
+    def do_GET(self):
+        if self.path == '/health':
+            return self.send_json({'status': 'ok'})
+        self.send_error(404)
+
+    def send_json(self, payload: Dict):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logging.debug(format % args)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='DART 수집 데이터 조회 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--index', action='store_true', help='공시 색인 후 종료')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("DART 데이터 조회 서버")
+    print("=" * 60)
+
+    service = RetrievalService()
+
+    if args.index:
+        print(f"\n✓ {service.index_filings():,}개 청크 색인 완료")
+    else:
+        ToolHandler.service = service
+        server = ThreadingHTTPServer((args.host, args.port), ToolHandler)
+        print(f"\n🚀 http://{args.host}:{args.port} 에서 대기 중 (Ctrl+C로 종료)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\n⚠️ 서버를 종료합니다")
+            server.server_close()
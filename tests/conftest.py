@@ -0,0 +1,14 @@
+"""
+테스트 공통 설정
+data_collector는 임포트 시 API 키를 확인하고 data/collection.log에 로그를 남기므로
+저장소 루트를 기준으로 더미 키를 넣고 임포트
+"""
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+os.environ.setdefault('DART_API_KEY', 'test-key-000000')
+os.chdir(ROOT)
+sys.path.insert(0, str(ROOT))
@@ -0,0 +1,255 @@
+"""
+data_collector.py 단위 테스트 (DART API는 호출하지 않음)
+"""
+import json
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+import data_collector
+from data_collector import ApiKeyPool, DartCollector, KeysExhaustedError
+
+TODAY = datetime.now().strftime('%Y%m%d')
+
+
+def make_filing(seq: int, corp_code: str = '00126380', report_nm: str = '분기보고서 (2024.09)') -> dict:
+    return {
+        'rcept_no': f'{TODAY}{seq:06d}',
+        'rcept_dt': TODAY,
+        'corp_code': corp_code,
+        'corp_name': '테스트',
+        'report_nm': report_nm,
+    }
+
+
+@pytest.fixture
+def collector(tmp_path, monkeypatch):
+    """__init__(CSV 로드, 키 풀 생성) 없이 경로만 임시 디렉터리로 설정한 수집기"""
+    monkeypatch.setattr(data_collector, 'WATCH_STATE_FILE', tmp_path / 'watch_state.json')
+    c = DartCollector.__new__(DartCollector)
+    c.base_path = tmp_path / 'raw'
+    c.companies_df = pd.DataFrame({'corp_name': ['테스트'], 'corp_code': ['00126380']})
+    return c
+
+
+class StopWatch(Exception):
+    pass
+
+
+def run_watch_cycles(collector, monkeypatch, cycles: int):
+    """watch()를 지정한 주기만큼만 실행"""
+    calls = []
+
+    def fake_sleep(seconds):
+        calls.append(seconds)
+        if len(calls) >= cycles:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(data_collector.time, 'sleep', fake_sleep)
+    collector.watch(interval=0)
+
+
+@pytest.fixture
+def make_pool(tmp_path):
+    """호출 간격 없이 임시 사용량 파일을 쓰는 키 풀"""
+    def make(keys, daily_quota=100):
+        return ApiKeyPool(keys, min_interval=0, daily_quota=daily_quota,
+                          usage_file=tmp_path / 'key_usage.json')
+    return make
+
+
+class FakeResponse:
+    def __init__(self, payload: dict):
+        self.status_code = 200
+        self.content = json.dumps(payload).encode('utf-8')
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+# API 키 풀 (user-027)
+
+def test_pool_prefers_least_used_key(make_pool):
+    pool = make_pool(['key-a-111111', 'key-b-222222'])
+    pool.keys[0].used = 5
+    assert pool.acquire().key == 'key-b-222222'
+
+
+def test_pool_resets_usage_on_new_day(make_pool):
+    pool = make_pool(['key-a-111111'], daily_quota=1)
+    pool.keys[0].used = 1
+    pool.date = '20000101'
+    assert pool.acquire().used == 1
+
+
+def test_pool_keeps_keys_with_same_suffix_apart(make_pool):
+    pool = make_pool(['aaaa-XXXXXX', 'bbbb-XXXXXX'])
+    pool.acquire()
+    pool.save_usage()
+    assert sorted(make_pool(['aaaa-XXXXXX', 'bbbb-XXXXXX']).keys[i].used for i in range(2)) == [0, 1]
+
+
+def test_all_keys_exhausted_raises(make_pool):
+    pool = make_pool(['key-a-111111', 'key-b-222222'], daily_quota=1)
+    pool.acquire()
+    pool.mark_invalid(pool.keys[1])
+    with pytest.raises(KeysExhaustedError):
+        pool.acquire()
+
+
+def test_request_fails_over_on_quota_status(collector, make_pool, monkeypatch):
+    collector.key_pool = make_pool(['key-a-111111', 'key-b-222222'])
+    used_keys = []
+
+    def fake_get(url, params, timeout):
+        used_keys.append(params['crtfc_key'])
+        status = '020' if params['crtfc_key'] == 'key-a-111111' else '000'
+        return FakeResponse({'status': status})
+
+    monkeypatch.setattr(data_collector.requests, 'get', fake_get)
+
+    assert collector.request('url', {}).json()['status'] == '000'
+    assert used_keys == ['key-a-111111', 'key-b-222222']
+    assert collector.key_pool.keys[0].used == collector.key_pool.daily_quota
+
+
+def test_collect_all_stops_without_failing_companies_when_keys_exhausted(collector, make_pool, monkeypatch):
+    collector.key_pool = make_pool(['key-a-111111'], daily_quota=1)
+    collector.key_pool.keys[0].used = 1
+    collector.companies_df = pd.DataFrame({'corp_name': ['A', 'B', 'C']})
+    collector.progress = {'completed': [], 'failed': []}
+    saves = []
+    collector.save_progress = lambda: saves.append(1)
+    monkeypatch.setattr(data_collector.requests, 'get', lambda *a, **kw: pytest.fail('요청하면 안 됨'))
+
+    collector.collect_all()
+
+    assert collector.progress == {'completed': [], 'failed': []}
+    assert len(saves) == 1
+
+
+# 정정공시 중복 제거 (user-029)
+
+ORIGINAL = {'rcept_no': '20240315000001', 'report_nm': '사업보고서 (2023.12)'}
+AMENDMENT = {'rcept_no': '20250102000002', 'report_nm': '[기재정정]사업보고서 (2023.12)'}
+
+
+def collect_latest_only(collector, monkeypatch, listings: dict, fail: set = frozenset()):
+    """연도별 목록을 주고 latest_only로 수집, 다운로드를 시도한 접수번호 반환"""
+    attempted = []
+
+    def fake_download(rcept_no, save_path):
+        attempted.append(rcept_no)
+        if rcept_no in fail:
+            return False
+        save_path.parent.mkdir(parents=True, exist_ok=True)
+        save_path.write_bytes(b'PK')
+        return True
+
+    collector.get_filings_list = lambda corp_code, bgn_de, end_de: listings.get(bgn_de[:4], [])
+    monkeypatch.setattr(collector, 'download_filing', fake_download)
+    collector.collect_filings('00126380', '테스트', years=list(listings), latest_only=True)
+    return attempted
+
+
+def test_amendment_in_later_year_supersedes_original(collector, monkeypatch):
+    attempted = collect_latest_only(collector, monkeypatch, {'2024': [ORIGINAL], '2025': [AMENDMENT]})
+
+    assert attempted == [AMENDMENT['rcept_no']]
+    amendments = json.loads((collector.base_path / 'filings' / '00126380' / 'amendments.json').read_text(encoding='utf-8'))
+    assert amendments['사업보고서 2023.12'] == {
+        'effective': AMENDMENT['rcept_no'],
+        'superseded': [ORIGINAL['rcept_no']],
+    }
+
+
+def test_original_kept_when_amendment_download_fails(collector, monkeypatch):
+    attempted = collect_latest_only(
+        collector, monkeypatch, {'2024': [ORIGINAL], '2025': [AMENDMENT]}, fail={AMENDMENT['rcept_no']}
+    )
+
+    assert attempted == [AMENDMENT['rcept_no'], ORIGINAL['rcept_no']]
+    assert collector.filing_stored('00126380', ORIGINAL['rcept_no'])
+
+
+def test_superseded_skipped_when_effective_stored_by_earlier_run(collector, monkeypatch):
+    collect_latest_only(collector, monkeypatch, {'2025': [AMENDMENT]})
+    attempted = collect_latest_only(collector, monkeypatch, {'2024': [ORIGINAL]})
+
+    assert attempted == []
+
+
+# 감시 모드 (user-026)
+
+def test_tracked_corp_codes_keeps_leading_zeros(tmp_path):
+    csv = tmp_path / 'companies.csv'
+    csv.write_text('corp_name,corp_code,stock_code\nA,01263022,282330\nB,,\n', encoding='utf-8')
+    c = DartCollector.__new__(DartCollector)
+    c.companies_df = pd.read_csv(csv, dtype={'corp_code': str, 'stock_code': str})
+    assert c.tracked_corp_codes() == {'01263022'}
+
+
+def test_poll_deduplicates_filings_repeated_across_pages(collector):
+    # 두 번째 페이지 조회 전에 새 공시가 들어와 첫 페이지 마지막 공시가 다시 나온 경우
+    pages = {
+        1: [make_filing(5), make_filing(4)],
+        2: [make_filing(4), make_filing(3)],
+    }
+    collector.get_recent_filings = lambda bgn, end, page_no: {'total_page': 2, 'list': pages[page_no]}
+
+    new_filings, newest = collector.poll_new_filings({'last_rcept_dt': TODAY, 'last_rcept_no': ''})
+
+    assert [f['rcept_no'] for f in new_filings] == [f'{TODAY}000003', f'{TODAY}000004', f'{TODAY}000005']
+    assert newest['last_rcept_no'] == f'{TODAY}000005'
+
+
+def test_poll_returns_nothing_when_a_page_fails(collector):
+    collector.get_recent_filings = lambda bgn, end, page_no: (
+        {'total_page': 2, 'list': [make_filing(2)]} if page_no == 1 else {}
+    )
+    assert collector.poll_new_filings({'last_rcept_dt': TODAY, 'last_rcept_no': ''}) == ([], None)
+
+
+def test_watch_failed_download_holds_mark_below_failed_filing(collector, monkeypatch):
+    listing = [make_filing(9, corp_code='99999999'), make_filing(7), make_filing(5), make_filing(3, corp_code='99999999')]
+    collector.get_recent_filings = lambda bgn, end, page_no: {'total_page': 1, 'list': listing}
+    monkeypatch.setattr(collector, 'download_filing', lambda rcept_no, path: rcept_no != f'{TODAY}000007')
+
+    run_watch_cycles(collector, monkeypatch, cycles=1)
+
+    state = json.loads(data_collector.WATCH_STATE_FILE.read_text(encoding='utf-8'))
+    assert state['last_rcept_no'] == f'{TODAY}000006'
+
+
+def test_watch_moves_mark_past_untracked_filings(collector, monkeypatch):
+    listing = [make_filing(9, corp_code='99999999'), make_filing(7)]
+    requested_pages = []
+
+    def fake_recent(bgn, end, page_no):
+        requested_pages.append(page_no)
+        return {'total_page': 1, 'list': listing}
+
+    collector.get_recent_filings = fake_recent
+    monkeypatch.setattr(collector, 'download_filing', lambda rcept_no, path: True)
+
+    run_watch_cycles(collector, monkeypatch, cycles=2)
+
+    state = json.loads(data_collector.WATCH_STATE_FILE.read_text(encoding='utf-8'))
+    assert state['last_rcept_no'] == f'{TODAY}000009'
+    assert requested_pages == [1, 1]
+
+
+def test_watch_retries_next_cycle_when_keys_exhausted(collector, monkeypatch):
+    cycles = []
+
+    def fake_recent(bgn, end, page_no):
+        cycles.append(page_no)
+        raise KeysExhaustedError('한도 초과')
+
+    collector.get_recent_filings = fake_recent
+
+    run_watch_cycles(collector, monkeypatch, cycles=2)
+
+    assert cycles == [1, 1]